@@ -0,0 +1,61 @@
+"""Backend HTTP routes for the Texture Tool application."""
+
+import os
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.routing import Route
+from .state import IMAGE_EXTS, MIME_BY_EXT, PREVIEW_MAX_SIZE, TEXTURE_ROUTE, downscaled_png, in_texture_root
+
+
+# URLs carry the file's mtime and size, so a response never goes stale
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def serve_texture(request: Request) -> Response:
+    """Serve an image file from disk, optionally downscaled to ?size=.
+
+    Only image files inside a texture directory some session has loaded
+    are served; the path is resolved first so symlinks and ".." can't
+    reach outside one. Starlette runs sync endpoints on its thread pool,
+    so decoding a downscaled preview doesn't block the event loop.
+    """
+    path = os.path.realpath(request.query_params.get("path", ""))
+    _, dot, ext = path.rpartition('.')
+    if not dot or ext.lower() not in IMAGE_EXTS or not in_texture_root(path):
+        return PlainTextResponse("Not found", status_code=404)
+    
+    try:
+        size = int(request.query_params.get("size", 0))
+    except ValueError:
+        size = -1
+    if size not in (0, PREVIEW_MAX_SIZE):
+        return PlainTextResponse("Invalid preview size", status_code=400)
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        return PlainTextResponse("Not found", status_code=404)
+    
+    if size:
+        try:
+            return Response(
+                downscaled_png(path, st, size),
+                media_type="image/png",
+                headers={"Cache-Control": CACHE_CONTROL},
+            )
+        except (OSError, ValueError):
+            # PIL can't decode or resample this file; let the browser try
+            # the original instead
+            pass
+    
+    # FileResponse streams the file and handles conditional requests
+    return FileResponse(
+        path,
+        stat_result=st,
+        media_type=MIME_BY_EXT.get('.' + ext.lower(), 'image/png'),
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
+
+
+api = Starlette(routes=[Route(TEXTURE_ROUTE, serve_texture)])
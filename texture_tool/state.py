@@ -1,29 +1,465 @@
 """State management for the Texture Tool application."""
 
 import reflex as rx
+import asyncio
+import dataclasses
+import hashlib
 import os
+import threading
 import io
-import base64
+import numpy as np
+import pybase64
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Set
+from urllib.parse import urlencode
 from PIL import Image
 
 
-class FileItem(rx.Base):
+# Lowercase file extensions (without the dot) shown in the file browser.
+IMAGE_EXTS = frozenset({'png', 'jpg', 'jpeg', 'bmp', 'tga', 'webp', 'exr', 'hdr'})
+
+# MIME types for served textures; anything else falls back to image/png
+MIME_BY_EXT = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.bmp': 'image/bmp',
+    '.webp': 'image/webp',
+}
+
+# Threads listing directories in parallel during load_images
+SCAN_WORKERS = 32
+
+# Bits kept per channel for 16-bit color: 5 for R and B, 6 for G
+RGB565_MASK = np.array([0xF8, 0xFC, 0xF8], dtype=np.uint8)
+
+# Units for the file size badge, one per power of 1024
+FILE_SIZE_UNITS = ('B', 'KB', 'MB')
+
+# Zoom levels offered as buttons in the preview toolbar, with their labels
+ZOOM_PRESETS = [
+    (0.125, "⅛×"),
+    (0.25, "¼×"),
+    (0.5, "½×"),
+    (1.0, "1×"),
+    (2.0, "2×"),
+    (3.0, "3×"),
+    (4.0, "4×"),
+]
+_ZOOM_LABELS = dict(ZOOM_PRESETS)
+
+# Largest side sent to the browser while zoomed out to 1x or less. Larger
+# textures are previewed from a downscaled copy until the user zooms in.
+PREVIEW_MAX_SIZE = 2048
+
+# Sidecar WEBP thumbnails, written in the background into THUMB_CACHE_DIRNAME
+# inside the texture directory the first time an image is previewed at
+# THUMB_SIZE or less. Later previews at that size are served from them.
+THUMB_SIZE = 256
+THUMB_CACHE_DIRNAME = '.texture_tool_cache'
+THUMB_WORKERS = 4
+
+# Recently encoded downscaled previews (PNG bytes), keyed by (full_path,
+# mtime_ns, size, preview_size) so that an edited file on disk is never
+# served stale. Filled from the texture route's worker threads.
+IMAGE_CACHE_SIZE = 8
+_image_cache: OrderedDict[tuple[str, int, int, int], bytes] = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+# Header metadata (format, width, height, file_size) of recently opened
+# images, keyed by (full_path, mtime_ns, size). Entries are tiny, so this
+# outlives the preview cache, and reselecting an image or zooming (which
+# can swap a downscaled preview for the original) skips the header parse.
+META_CACHE_SIZE = 16
+_meta_cache: OrderedDict[tuple[str, int, int], tuple[str, int, int, str]] = OrderedDict()
+
+_thumb_pool = ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix="texture-thumbs")
+_thumb_jobs: Set[str] = set()  # Thumbnail paths with a job queued
+_thumb_failed: Set[str] = set()  # Thumbnail paths PIL couldn't produce; not retried
+_thumb_jobs_lock = threading.Lock()
+
+# Path of the backend route that serves texture files (see api.py)
+TEXTURE_ROUTE = '/texture'
+
+# Real paths of the texture directories loaded by any session. The texture
+# route only serves files inside one of these.
+_texture_roots: Set[str] = set()
+
+# Preview fields for a selection that could not be loaded
+EMPTY_PREVIEW = ("", "", "", "", 0, 0, 0)
+
+
+def _cache_get(cache: OrderedDict, key):
+    """Look up an LRU OrderedDict entry, marking it most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key, value, max_entries: int):
+    """Insert into an LRU OrderedDict, evicting the oldest entry when full."""
+    cache[key] = value
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _format_file_size(size: int) -> str:
+    """Format a byte count as B, KB or MB."""
+    # Every 10 bits of the size is one 1024x unit step
+    unit = min(max(size.bit_length() - 1, 0) // 10, len(FILE_SIZE_UNITS) - 1)
+    if unit == 0:
+        return f"{size} B"
+    return f"{size / (1 << (10 * unit)):.1f} {FILE_SIZE_UNITS[unit]}"
+
+
+def _header_info(source: str | BinaryIO) -> tuple[str | None, int, int]:
+    """Read (format, width, height) from an image path or open binary file.
+
+    Use this whenever only metadata is needed. Image.open parses just the
+    header; calling load() (or anything that touches pixels) would decode
+    the whole texture.
+    """
+    with Image.open(source) as img:
+        return img.format, img.width, img.height
+
+
+def _quantize_rgb565(img: Image.Image) -> Image.Image:
+    """Reduce an image to 16-bit 5-6-5 color, returned as RGB."""
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    # np.array gives a writable copy, so the mask is applied in place in a
+    # single vectorized pass with no second buffer
+    pixels = np.array(img)
+    pixels &= RGB565_MASK
+    return Image.fromarray(pixels)
+
+
+def _to_8bit(img: Image.Image) -> Image.Image:
+    """Scale 16-bit grayscale (e.g. heightmaps) down to 8-bit L.
+
+    thumbnail() can't resample I;16 images. Keeping the high byte
+    preserves the full range instead of clipping everything above 255.
+    Other modes are returned unchanged.
+    """
+    if img.mode == 'I' or img.mode.startswith('I;16'):
+        return img.convert('I').point(lambda v: v / 256).convert('L')
+    return img
+
+
+def _preview_size_for(zoom: float, longest_side: int) -> int:
+    """Longest side worth sending for an image shown at this zoom level.
+
+    0 means the original file is sent as-is.
+    """
+    if zoom > 1.0:
+        return 0
+    if THUMB_SIZE < longest_side and longest_side * zoom <= THUMB_SIZE:
+        return THUMB_SIZE
+    if longest_side > PREVIEW_MAX_SIZE:
+        return PREVIEW_MAX_SIZE
+    return 0
+
+
+def _thumb_path(texture_directory: str, key: tuple[str, int, int]) -> str:
+    """Sidecar thumbnail location for a (full_path, mtime_ns, size) key."""
+    digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+    return os.path.join(texture_directory, THUMB_CACHE_DIRNAME, f"{digest}.webp")
+
+
+def _ensure_cache_dir(cache_dir: str) -> bool:
+    """Create a thumbnail cache folder, returning False if it can't be.
+
+    Only called once a thumbnail is actually needed, so merely browsing a
+    directory writes nothing into it. Creating the folder bumps the texture
+    directory's mtime, which costs a single extra rescan on the next refresh.
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Keep Godot from importing the cached thumbnails
+        open(os.path.join(cache_dir, '.gdignore'), 'a').close()
+    except OSError:
+        return False  # Read-only texture directory; previews work without thumbnails
+    return True
+
+
+def _write_thumbnail(full_path: str, thumb_path: str):
+    """Write the sidecar thumbnail for one version of an image."""
+    # Write under a temporary name so readers never see a partial file
+    tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+    failed = False
+    try:
+        with Image.open(full_path) as img:
+            img = _to_8bit(img)
+            img.thumbnail((THUMB_SIZE, THUMB_SIZE))
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            img.save(tmp_path, format='WEBP', quality=75)
+        os.replace(tmp_path, thumb_path)
+    except (OSError, ValueError):
+        # Thumbnails are best effort: files PIL can't decode or resample
+        # simply keep using the regular preview path
+        failed = True
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    finally:
+        with _thumb_jobs_lock:
+            _thumb_jobs.discard(thumb_path)
+            if failed:
+                _thumb_failed.add(thumb_path)
+
+
+def _queue_thumbnail(full_path: str, thumb_path: str):
+    """Generate a missing sidecar thumbnail on the background pool."""
+    with _thumb_jobs_lock:
+        if thumb_path in _thumb_jobs or thumb_path in _thumb_failed:
+            return
+        if not _ensure_cache_dir(os.path.dirname(thumb_path)):
+            return
+        _thumb_jobs.add(thumb_path)
+        _thumb_pool.submit(_write_thumbnail, full_path, thumb_path)
+
+
+def in_texture_root(real_path: str) -> bool:
+    """Whether a resolved path lies inside a loaded texture directory."""
+    return any(real_path.startswith(os.path.join(root, '')) for root in _texture_roots)
+
+
+def _texture_url(path: str, key: tuple[str, int, int], preview_size: int = 0) -> str:
+    """Backend URL that serves an image file, or a downscaled copy of it.
+
+    The mtime and size from key are part of the URL, so the browser can
+    cache responses and an edited file gets a fresh URL.
+    """
+    query = {'path': path, 'v': f"{key[1]}-{key[2]}"}
+    if preview_size:
+        query['size'] = preview_size
+    return f"{rx.config.get_config().api_url}{TEXTURE_ROUTE}?{urlencode(query)}"
+
+
+def _image_meta(full_path: str, image_path: str, key: tuple[str, int, int]) -> tuple[str, int, int, str]:
+    """(format, width, height, file_size) for an image, from the header."""
+    meta = _cache_get(_meta_cache, key)
+    if meta is None:
+        image_format, width, height = _header_info(full_path)
+        meta = (
+            image_format or Path(image_path).suffix.upper().lstrip('.'),
+            width,
+            height,
+            _format_file_size(key[2]),
+        )
+        _cache_put(_meta_cache, key, meta, META_CACHE_SIZE)
+    return meta
+
+
+def _preview_url(key: tuple[str, int, int], longest_side: int, zoom: float, thumb_path: str) -> tuple[int, str]:
+    """Pick the preview tier for an image and build its URL.
+
+    The preview is the sidecar thumbnail, a downscaled PNG, or the original
+    file, depending on how large the image is shown at this zoom level (see
+    _preview_size_for). A missing thumbnail is queued for next time, and
+    this preview falls back to the next tier. Returns (preview_size, url),
+    where preview_size is 0 for the original.
+    """
+    preview_size = _preview_size_for(zoom, longest_side)
+    if preview_size == THUMB_SIZE:
+        if os.path.exists(thumb_path):
+            return preview_size, _texture_url(thumb_path, key)
+        # Thumbnail not generated yet: make one for next time and fall back
+        _queue_thumbnail(key[0], thumb_path)
+        preview_size = PREVIEW_MAX_SIZE if longest_side > PREVIEW_MAX_SIZE else 0
+    return preview_size, _texture_url(key[0], key, preview_size)
+
+
+def downscaled_png(full_path: str, st: os.stat_result, preview_size: int) -> bytes:
+    """PNG bytes of an image shrunk to fit preview_size, cached per version."""
+    key = (full_path, st.st_mtime_ns, st.st_size, preview_size)
+    with _image_cache_lock:
+        data = _cache_get(_image_cache, key)
+    if data is None:
+        with Image.open(full_path) as img:
+            img = _to_8bit(img)
+            img.thumbnail((preview_size, preview_size), Image.BILINEAR)
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+                img = img.convert('RGBA')
+            buffered = io.BytesIO()
+            # Only a preview, so favor encode speed over compression ratio
+            img.save(buffered, format="PNG", optimize=False, compress_level=1)
+        data = buffered.getvalue()
+        with _image_cache_lock:
+            _cache_put(_image_cache, key, data, IMAGE_CACHE_SIZE)
+    return data
+
+
+@dataclasses.dataclass(slots=True)
+class FileItem:
     """Represents a file or folder item."""
     name: str
     path: str
     is_folder: bool
     level: int
     parent: str
+    indent: str  # Row padding for this level, as a CSS length
+    is_root: bool  # Directly inside texture_directory, so always visible
+
+
+@dataclasses.dataclass
+class TreeRows:
+    """The visible rows of the file tree, stored as one list per column.
+
+    Sent to the client as a handful of flat arrays rather than one object
+    per row, which leaves the repeated field names out of the payload.
+    """
+    names: List[str] = dataclasses.field(default_factory=list)
+    paths: List[str] = dataclasses.field(default_factory=list)
+    indents: List[str] = dataclasses.field(default_factory=list)
+    is_folder: List[bool] = dataclasses.field(default_factory=list)
+    is_expanded: List[bool] = dataclasses.field(default_factory=list)
+
+
+def _dir_mtime(dir_path: str) -> int:
+    """mtime_ns of a directory, or -1 if it can't be read."""
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scan_dir(dir_path: str) -> tuple[List[str], List[str], int]:
+    """List one directory as (subfolder names, image file names, mtime_ns).
+
+    Unreadable directories are treated as empty.
+    """
+    subdirs = []
+    image_files = []
+    # Taken before listing, so on filesystems with fine-grained mtimes a
+    # change made during the scan shows up as a newer mtime next time.
+    # Coarse (FAT/SMB, 2 s) or cached (NFS) mtimes can miss it; see
+    # load_images for how a repeated refresh still picks it up.
+    mtime_ns = _dir_mtime(dir_path)
+    # DirEntry caches the file type from the directory listing, so
+    # classifying entries here costs no extra stat calls.
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name != THUMB_CACHE_DIRNAME:
+                        subdirs.append(name)
+                    continue
+                
+                # A bare dotfile such as ".png" has no suffix, as with Path
+                stem, dot, ext = name.rpartition('.')
+                if dot and stem and ext.lower() in IMAGE_EXTS and entry.is_file():
+                    image_files.append(name)
+    except OSError:
+        return [], [], mtime_ns
+    return subdirs, image_files, mtime_ns
+
+
+class _Node:
+    """A folder in the scanned texture tree."""
+    __slots__ = ('name', 'path', 'level', 'children', 'files')
+    
+    def __init__(self, name: str, path: str, level: int):
+        self.name = name
+        self.path = path
+        self.level = level
+        self.children: List["_Node"] = []
+        self.files: List[str] = []
+
+
+def _scan_tree(texture_directory: str) -> tuple[List[FileItem], dict[str, int]]:
+    """Scan texture_directory into a flat, display-ordered list of items.
+
+    Also returns the mtime_ns of every scanned folder, keyed by its path
+    relative to texture_directory ("" for the root itself).
+    """
+    if not os.path.exists(texture_directory):
+        return [], {}
+
+    # First, collect all folders and files. Directory listings are
+    # latency-bound on network shares, so every listing runs on a pool
+    # thread while this one assembles the tree from the results.
+    root = _Node("", "", -1)
+    dir_mtimes = {}
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_dir, texture_directory): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = pending.pop(future)
+                subdirs, node.files, dir_mtimes[node.path] = future.result()
+                for name in subdirs:
+                    child = _Node(
+                        name,
+                        os.path.join(node.path, name) if node.path else name,
+                        node.level + 1
+                    )
+                    node.children.append(child)
+                    sub_path = os.path.join(texture_directory, child.path)
+                    pending[pool.submit(_scan_dir, sub_path)] = child
+
+    # Build the final list with proper ordering: each folder's files,
+    # then its subfolders, each followed by their own contents
+    items = []
+
+    def add_children(node):
+        prefix = node.path + os.sep if node.path else ""
+        level = node.level + 1
+        indent = f"{level * 20 + 8}px"  # Shared by every row at this level
+        is_root = node is root
+        for name in sorted(node.files):
+            items.append(FileItem(
+                name=name,
+                path=prefix + name,
+                is_folder=False,
+                level=level,
+                parent=node.path,
+                indent=indent,
+                is_root=is_root
+            ))
+        for child in sorted(node.children, key=lambda x: x.name):
+            items.append(FileItem(
+                name=child.name,
+                path=child.path,
+                is_folder=True,
+                level=child.level,
+                parent=node.path,
+                indent=indent,
+                is_root=is_root
+            ))
+            add_children(child)
+
+    add_children(root)
+    return items, dir_mtimes
+
+
+def _tree_unchanged(texture_directory: str, dir_mtimes: dict[str, int]) -> bool:
+    """Whether no folder from a previous _scan_tree has changed since.
+
+    A folder's mtime moves whenever an entry is added, removed or renamed
+    in it, so matching mtimes for every folder mean the listing would come
+    out the same.
+    """
+    if not dir_mtimes:
+        return False
+    paths = [os.path.join(texture_directory, rel_path) for rel_path in dir_mtimes]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        return list(pool.map(_dir_mtime, paths)) == list(dir_mtimes.values())
 
 
 class State(rx.State):
     """The app state."""
-    file_items: List[FileItem] = []
+    _file_items: List[FileItem] = []  # Whole tree; the client only gets visible_rows
     expanded_folders: List[str] = []
     selected_image: str = ""
-    selected_image_data: str = ""
+    selected_image_url: str = ""
     image_format: str = ""
     image_resolution: str = ""
     image_file_size: str = ""
@@ -31,6 +467,10 @@ class State(rx.State):
     zoom_level: float = 1.0
     image_width: int = 0
     image_height: int = 0
+    _preview_size: int = 0  # Longest side of a reduced preview; 0 for the original
+    _scanned_dir: str = ""  # texture_directory as of the last scan
+    _dir_mtimes: dict[str, int] = {}  # Folder mtimes from the last scan
+    _force_rescan: bool = False  # Set after a skipped load; the next one always scans
     directory_input: str = ""
 
     # Resize properties
@@ -70,16 +510,7 @@ class State(rx.State):
             # Apply color depth reduction for PS1 effect
             if self.color_depth == 16:
                 # Convert to 16-bit color (5-6-5 RGB)
-                resized = resized.convert('RGB')
-                pixels = resized.load()
-                for y in range(resized.height):
-                    for x in range(resized.width):
-                        r, g, b = pixels[x, y]
-                        # 5 bits for R and B, 6 bits for G
-                        r = (r >> 3) << 3
-                        g = (g >> 2) << 2
-                        b = (b >> 3) << 3
-                        pixels[x, y] = (r, g, b)
+                resized = _quantize_rgb565(resized)
             elif self.color_depth == 8:
                 # 8-bit color palette
                 resized = resized.convert('P', palette=Image.ADAPTIVE, colors=256)
@@ -91,10 +522,11 @@ class State(rx.State):
                 if self.dithering:
                     resized = resized.convert('RGB')
             
-            # Convert to base64 for display
+            # Convert to base64 for display. The data URI is only a preview,
+            # so favor encode speed over compression ratio.
             buffered = io.BytesIO()
-            resized.save(buffered, format="PNG")
-            processed_data = base64.b64encode(buffered.getvalue()).decode('utf-8')
+            resized.save(buffered, format="PNG", optimize=False, compress_level=1)
+            processed_data = pybase64.b64encode(buffered.getvalue()).decode('ascii')
             self.processed_image_data = f"data:image/png;base64,{processed_data}"
             self.show_processed = True
             
@@ -133,7 +565,7 @@ class State(rx.State):
     def on_load(self):
         """Auto-load images when the page loads."""
         self.directory_input = self.texture_directory  # Initialize input with current directory
-        self.load_images()
+        return State.load_images
     
     def update_directory(self):
         """Update the texture directory and reload images."""
@@ -143,8 +575,10 @@ class State(rx.State):
         if os.path.exists(new_directory) and os.path.isdir(new_directory):
             self.texture_directory = new_directory
             self.selected_image = ""  # Clear current selection
-            self.selected_image_data = ""
-            self.load_images()
+            self.selected_image_url = ""
+            with _image_cache_lock:
+                _image_cache.clear()
+            return State.load_images
         else:
             return rx.window_alert(f"Invalid directory: {new_directory}")
 
@@ -157,151 +591,134 @@ class State(rx.State):
             self.texture_directory = parent_dir
             self.directory_input = parent_dir
             self.selected_image = ""  # Clear current selection
-            self.selected_image_data = ""
-            self.load_images()
+            self.selected_image_url = ""
+            with _image_cache_lock:
+                _image_cache.clear()
+            return State.load_images
         else:
             return rx.window_alert("Already at root directory")
 
-    def load_images(self):
+    async def load_images(self):
         """Load all image files and build a flat list with hierarchy info."""
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tga', '.webp', '.exr', '.hdr'}
-        
-        if not os.path.exists(self.texture_directory):
-            self.file_items = []
+        # The scan blocks on directory listings, so it runs off the event
+        # loop to keep other sessions responsive during large refreshes.
+        # When no folder changed since the last scan, _file_items is left
+        # as is so the client has nothing to re-render. Folder mtimes can
+        # be too coarse or stale to see every change (FAT/SMB, NFS), so
+        # only one load in a row is skipped: clicking Refresh again after
+        # a skipped refresh always rescans.
+        texture_directory = self.texture_directory
+        if os.path.isdir(texture_directory):
+            _texture_roots.add(os.path.realpath(texture_directory))
+        if (
+            not self._force_rescan
+            and texture_directory == self._scanned_dir
+            and await asyncio.to_thread(_tree_unchanged, texture_directory, self._dir_mtimes)
+        ):
+            self._force_rescan = True
             return
         
-        items = []
-        
-        # First, collect all folders and files
-        folder_contents = {}
-        
-        for root, dirs, files in os.walk(self.texture_directory):
-            relative_root = os.path.relpath(root, self.texture_directory)
-            if relative_root == ".":
-                relative_root = ""
-            
-            # Store folder structure
-            if relative_root:
-                parts = relative_root.split(os.sep)
-                for i, part in enumerate(parts):
-                    folder_path = os.sep.join(parts[:i+1])
-                    parent = os.sep.join(parts[:i]) if i > 0 else ""
-                    
-                    if folder_path not in folder_contents:
-                        folder_contents[folder_path] = {
-                            'item': FileItem(
-                                name=part,
-                                path=folder_path,
-                                is_folder=True,
-                                level=i,
-                                parent=parent
-                            ),
-                            'children': []
-                        }
-            
-            # Collect image files
-            image_files = []
-            for file in files:
-                if Path(file).suffix.lower() in image_extensions:
-                    file_path = os.path.join(relative_root, file) if relative_root else file
-                    level = len(relative_root.split(os.sep)) if relative_root else 0
-                    image_files.append(FileItem(
-                        name=file,
-                        path=file_path,
-                        is_folder=False,
-                        level=level,
-                        parent=relative_root
-                    ))
-            
-            # Store files in their parent folder
-            if relative_root and relative_root in folder_contents:
-                folder_contents[relative_root]['children'].extend(image_files)
-            elif not relative_root:
-                # Root level files
-                items.extend(sorted(image_files, key=lambda x: x.name))
-        
-        # Build the final list with proper ordering
-        def add_folder_and_children(folder_path, folder_data):
-            items.append(folder_data['item'])
-            # Add immediate children (files)
-            for child in sorted(folder_data['children'], key=lambda x: x.name):
-                items.append(child)
-            # Add subfolders
-            for sub_path, sub_data in sorted(folder_contents.items()):
-                if sub_data['item'].parent == folder_path:
-                    add_folder_and_children(sub_path, sub_data)
-        
-        # Add root level folders
-        for folder_path, folder_data in sorted(folder_contents.items()):
-            if not folder_data['item'].parent:  # Root level folder
-                add_folder_and_children(folder_path, folder_data)
+        self._force_rescan = False
+        items, dir_mtimes = await asyncio.to_thread(_scan_tree, texture_directory)
         
-        self.file_items = items
+        self._file_items = items
+        self._scanned_dir = texture_directory
+        self._dir_mtimes = dir_mtimes
+    
+    @rx.var(cache=True)
+    def visible_rows(self) -> TreeRows:
+        """Rows for the items whose ancestor folders are all expanded."""
+        # _file_items lists every folder before its contents, so one pass
+        # can track which folders have their contents visible
+        expanded = set(self.expanded_folders)
+        open_folders = set()
+        rows = TreeRows()
+        for item in self._file_items:
+            if item.is_root or item.parent in open_folders:
+                is_expanded = item.is_folder and item.path in expanded
+                if is_expanded:
+                    open_folders.add(item.path)
+                rows.names.append(item.name)
+                rows.paths.append(item.path)
+                rows.indents.append(item.indent)
+                rows.is_folder.append(item.is_folder)
+                rows.is_expanded.append(is_expanded)
+        return rows
     
     def toggle_folder(self, folder_path: str):
         """Toggle folder expansion state."""
+        # expanded_folders only holds the open folders, so scanning it is
+        # cheap; visible_rows builds its own set for the per-item lookups
         if folder_path in self.expanded_folders:
-            # When collapsing a folder, also collapse all its subfolders
+            # When collapsing a folder, also collapse all its subfolders,
+            # in a single pass that assigns the list once
+            prefix = folder_path + os.sep
             self.expanded_folders = [
-                f for f in self.expanded_folders 
-                if f != folder_path and not f.startswith(folder_path + os.sep)
+                f for f in self.expanded_folders
+                if f != folder_path and not f.startswith(prefix)
             ]
         else:
             # When expanding, just add this folder
-            self.expanded_folders = self.expanded_folders + [folder_path]
+            self.expanded_folders.append(folder_path)
     
     def select_image(self, image_path: str):
-        """Select an image to display and load it as base64."""
-        self.selected_image = image_path
-        
-        # Load image as base64 and extract metadata
+        """Select an image to display and point the preview at its URL."""
+        # Only metadata is read here; the browser fetches the pixels from
+        # the texture route
         full_path = os.path.join(self.texture_directory, image_path)
         try:
-            # Get file size
-            file_size = os.path.getsize(full_path)
-            if file_size < 1024:
-                self.image_file_size = f"{file_size} B"
-            elif file_size < 1024 * 1024:
-                self.image_file_size = f"{file_size / 1024:.1f} KB"
-            else:
-                self.image_file_size = f"{file_size / (1024 * 1024):.1f} MB"
+            st = os.stat(full_path)
+            key = (full_path, st.st_mtime_ns, st.st_size)
+            meta = _image_meta(full_path, image_path, key)
+            preview_size, url = _preview_url(
+                key, max(meta[1], meta[2]), self.zoom_level,
+                _thumb_path(self.texture_directory, key)
+            )
             
-            # Load image with PIL to get metadata
-            with Image.open(full_path) as img:
-                self.image_format = img.format or Path(image_path).suffix.upper().lstrip('.')
-                self.image_resolution = f"{img.width} × {img.height}"
-                self.image_width = img.width
-                self.image_height = img.height
-            
-            # Load image as base64
-            with open(full_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-                # Get file extension to determine MIME type
-                ext = Path(image_path).suffix.lower()
-                if ext in ['.jpg', '.jpeg']:
-                    mime_type = 'image/jpeg'
-                elif ext == '.png':
-                    mime_type = 'image/png'
-                elif ext == '.bmp':
-                    mime_type = 'image/bmp'
-                elif ext == '.webp':
-                    mime_type = 'image/webp'
-                else:
-                    mime_type = 'image/png'  # Default fallback
-                
-                self.selected_image_data = f"data:{mime_type};base64,{image_data}"
+            image_format, width, height, file_size = meta
+            preview = (
+                url,
+                image_format,
+                f"{width} × {height}",
+                file_size,
+                width,
+                height,
+                preview_size,
+            )
         except Exception as e:
             print(f"Error loading image: {e}")
-            self.selected_image_data = ""
-            self.image_format = ""
-            self.image_resolution = ""
-            self.image_file_size = ""
-            self.image_width = 0
-            self.image_height = 0
+            preview = EMPTY_PREVIEW
+        
+        # Assign the whole selection at once, after all disk work,
+        # so the state never mixes fields from two images and the event
+        # produces one delta
+        self.selected_image = image_path
+        (
+            self.selected_image_url,
+            self.image_format,
+            self.image_resolution,
+            self.image_file_size,
+            self.image_width,
+            self.image_height,
+            self._preview_size,
+        ) = preview
+    
+    def _reload_if_downscaled(self):
+        """Reload the selection when its reduced preview is too small to zoom."""
+        if self._preview_size:
+            wanted = _preview_size_for(self.zoom_level, max(self.image_width, self.image_height))
+            if wanted == 0 or wanted > self._preview_size:
+                self.select_image(self.selected_image)
+    
+    @rx.var(cache=True)
+    def active_zoom_label(self) -> str:
+        """Label of the zoom preset matching the current zoom level."""
+        return _ZOOM_LABELS.get(self.zoom_level, "")
     
     def set_zoom(self, level: float):
         """Set the zoom level."""
         self.zoom_level = level
+        self._reload_if_downscaled()
     
     def zoom_in(self):
         """Increase zoom level."""
@@ -310,6 +727,7 @@ class State(rx.State):
                 self.zoom_level = min(self.zoom_level * 2, 1.0)
             else:
                 self.zoom_level = min(self.zoom_level + 1.0, 4.0)
+            self._reload_if_downscaled()
     
     def zoom_out(self):
         """Decrease zoom level."""
@@ -1,10 +1,11 @@
 """Texture Tool - Image Viewer for Godot textures."""
 
 import reflex as rx
+from .api import api
 from .ui import index
 
 
 
 
-app = rx.App()
+app = rx.App(api_transformer=api)
 app.add_page(index)
@@ -1,93 +1,102 @@
 """UI components for the Texture Tool application."""
 
 import reflex as rx
-from .state import State, FileItem
+from .state import State, ZOOM_PRESETS
 
 
-def is_item_visible(item: FileItem) -> rx.Var:
-    """Check if an item should be visible based on parent folder expansion."""
-    # For root items (parent is empty string), always visible
-    # For items with parents, check if parent is expanded
-    return rx.cond(
-        item.parent == "",
-        True,  # Root items always visible
-        State.expanded_folders.contains(item.parent)  # Check if parent folder is expanded
-    )
+# Let the browser skip layout and paint for tree rows scrolled out of view,
+# so long lists only cost what is on screen. The intrinsic size matches the
+# row min_height and keeps the scrollbar stable.
+ROW_VIRTUALIZATION = {
+    "content_visibility": "auto",
+    "contain_intrinsic_size": "auto 32px",
+}
 
 
-def folder_item(item: FileItem) -> rx.Component:
+@rx.memo
+def folder_item(name: rx.Var[str], path: rx.Var[str], indent: rx.Var[str], is_expanded: rx.Var[bool]) -> rx.Component:
     """Create a folder button."""
     return rx.button(
         rx.hstack(
             rx.cond(
-                State.expanded_folders.contains(item.path),
+                is_expanded,
                 rx.text("📂", font_size="16px", width="20px", text_align="center"),
                 rx.text("📁", font_size="16px", width="20px", text_align="center")
             ),
-            rx.text(item.name, font_size="14px", white_space="nowrap", overflow="hidden", text_overflow="ellipsis"),
+            rx.text(name, font_size="14px", white_space="nowrap", overflow="hidden", text_overflow="ellipsis"),
             spacing="2",
             align="center",
             width="100%"
         ),
-        on_click=State.toggle_folder(item.path),
+        on_click=State.toggle_folder(path),
         variant="ghost",
         width="100%",
         justify="start",
-        padding_left=f"{item.level * 20 + 8}px",
+        padding_left=indent,
         padding_y="2",
-        min_height="32px"
+        min_height="32px",
+        **ROW_VIRTUALIZATION
     )
 
 
-def file_item(item: FileItem) -> rx.Component:
+@rx.memo
+def file_item(name: rx.Var[str], path: rx.Var[str], indent: rx.Var[str]) -> rx.Component:
     """Create a file button."""
     return rx.button(
         rx.hstack(
             rx.text("🖼️", font_size="16px", width="20px", text_align="center"),
-            rx.text(item.name, font_size="14px", white_space="nowrap", overflow="hidden", text_overflow="ellipsis"),
+            rx.text(name, font_size="14px", white_space="nowrap", overflow="hidden", text_overflow="ellipsis"),
             spacing="2",
             align="center",
             width="100%"
         ),
-        on_click=State.select_image(item.path),
+        on_click=State.select_image(path),
         variant="ghost",
         width="100%",
         justify="start", 
-        padding_left=f"{item.level * 20 + 8}px",
+        padding_left=indent,
         padding_y="2",
-        min_height="32px"
+        min_height="32px",
+        **ROW_VIRTUALIZATION
     )
 
 
-def tree_item(item: FileItem) -> rx.Component:
-    """Create a tree item (folder or file)."""
+def tree_item(path: rx.Var[str], index: rx.Var[int]) -> rx.Component:
+    """Create a tree item (folder or file) from row index of State.visible_rows."""
+    # Hidden items are already filtered out by State.visible_rows.
+    # Rows are memoized components that only see plain props, so React can
+    # skip re-rendering rows whose item didn't change.
+    rows = State.visible_rows
     return rx.cond(
-        is_item_visible(item),
-        rx.cond(
-            item.is_folder,
-            folder_item(item),
-            file_item(item)
-        ),
-        rx.fragment()  # Return empty fragment for hidden items
+        rows.is_folder[index],
+        folder_item(name=rows.names[index], path=path, indent=rows.indents[index], is_expanded=rows.is_expanded[index]),
+        file_item(name=rows.names[index], path=path, indent=rows.indents[index])
     )
 
 
 def image_list_panel() -> rx.Component:
     """Create the image list panel."""
     return rx.card(
-        rx.vstack(
-            rx.foreach(
-                State.file_items,
-                tree_item
+        rx.scroll_area(
+            rx.vstack(
+                rx.foreach(
+                    State.visible_rows.paths,
+                    tree_item
+                ),
+                width="100%",
+                align="start",
+                spacing="0"
             ),
-            width="100%",
-            align="start",
-            spacing="0"
+            type="auto",
+            scrollbars="vertical",
+            height="100%"
         ),
         width="400px",
-        min_width="400px"
+        min_width="400px",
+        height="100%"
     )
 
+@rx.memo
 def zoom_controls() -> rx.Component:
     """Create zoom control buttons."""
     return rx.hstack(
@@ -98,47 +107,14 @@ def zoom_controls() -> rx.Component:
             variant="soft",
             disabled=State.zoom_level <= 0.125
         ),
-        rx.button(
-            "⅛×",
-            on_click=State.set_zoom(0.125),
-            size="1",
-            variant=rx.cond(State.zoom_level == 0.125, "solid", "soft")
-        ),
-        rx.button(
-            "¼×",
-            on_click=State.set_zoom(0.25),
-            size="1",
-            variant=rx.cond(State.zoom_level == 0.25, "solid", "soft")
-        ),
-        rx.button(
-            "½×",
-            on_click=State.set_zoom(0.5),
-            size="1",
-            variant=rx.cond(State.zoom_level == 0.5, "solid", "soft")
-        ),
-        rx.button(
-            "1×",
-            on_click=State.set_zoom(1.0),
-            size="1",
-            variant=rx.cond(State.zoom_level == 1.0, "solid", "soft")
-        ),
-        rx.button(
-            "2×",
-            on_click=State.set_zoom(2.0),
-            size="1",
-            variant=rx.cond(State.zoom_level == 2.0, "solid", "soft")
-        ),
-        rx.button(
-            "3×",
-            on_click=State.set_zoom(3.0),
-            size="1",
-            variant=rx.cond(State.zoom_level == 3.0, "solid", "soft")
-        ),
-        rx.button(
-            "4×",
-            on_click=State.set_zoom(4.0),
-            size="1",
-            variant=rx.cond(State.zoom_level == 4.0, "solid", "soft")
+        rx.foreach(
+            ZOOM_PRESETS,
+            lambda preset: rx.button(
+                preset[1],
+                on_click=State.set_zoom(preset[0]),
+                size="1",
+                variant=rx.cond(State.active_zoom_label == preset[1], "solid", "soft")
+            )
         ),
         rx.button(
             "+",
@@ -169,11 +145,21 @@ def image_preview_panel() -> rx.Component:
                         spacing="2",
                         align="center"
                     ),
-                    rx.html(
-                        f'<img src="{State.selected_image_data}" '
-                        f'width="{State.image_width * State.zoom_level}px" '
-                        f'height="{State.image_height * State.zoom_level}px" '
-                        f'style="image-rendering: pixelated; image-rendering: -moz-crisp-edges; image-rendering: crisp-edges;" />'
+                    # The image keeps its native size and zoom is a transform,
+                    # so zooming doesn't rebuild or re-decode it. The wrapper
+                    # box takes the zoomed size so the layout still fits it.
+                    rx.box(
+                        rx.image(
+                            src=State.selected_image_url,
+                            width=f"{State.image_width}px",
+                            height=f"{State.image_height}px",
+                            max_width="none",
+                            transform=f"scale({State.zoom_level})",
+                            transform_origin="top left",
+                            image_rendering="pixelated"
+                        ),
+                        width=f"{State.image_width * State.zoom_level}px",
+                        height=f"{State.image_height * State.zoom_level}px"
                     ),
                     spacing="3",
                     align="start",
@@ -196,12 +182,18 @@ def directory_selector() -> rx.Component:
             variant="soft",
             title="Go up one directory"
         ),
-        rx.input(
-            value=State.directory_input,
-            on_change=State.set_directory_input,
-            placeholder="Enter texture directory path...",
-            width="400px",
-            size="2"
+        # Nothing reacts to the path while it's typed, so only sync it once
+        # typing pauses. Blur and Enter still flush it immediately, before
+        # Change Directory reads it.
+        rx.debounce_input(
+            rx.input(
+                value=State.directory_input,
+                on_change=State.set_directory_input,
+                placeholder="Enter texture directory path...",
+                width="400px",
+                size="2"
+            ),
+            debounce_timeout=500
         ),
         rx.button(
             "Change Directory",